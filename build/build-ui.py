@@ -29,11 +29,13 @@ def yarn(*args):
 
 
 def build_ui():
-    ui_dir = pathlib.Path(__file__).parent.parent.joinpath("ui")
+    ui_dir = (pathlib.Path(__file__).resolve().parent.parent / "ui").as_posix()
 
     sys.stderr.write(f"\nBuilding UI in {ui_dir}\n")
-    yarn("--cwd", ui_dir.as_posix(), "install")
-    yarn("--cwd", ui_dir.as_posix(), "build")
+    # 'build' depends on the packages installed by 'install',
+    # so both steps must run in order.
+    yarn("--cwd", ui_dir, "install")
+    yarn("--cwd", ui_dir, "build")
     sys.stderr.write(f"UI built in {ui_dir}\n\n")
 
 
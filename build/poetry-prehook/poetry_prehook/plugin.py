@@ -18,6 +18,7 @@
 
 import subprocess
 import sys
+import threading
 from typing import List
 
 from cleo.events.console_events import COMMAND
@@ -74,20 +75,10 @@ class PreHookPlugin(ApplicationPlugin):
             io.write_line(f"<comment>Executing: {script}</comment>")
 
             try:
-                result = subprocess.run(
-                    script, shell=True, cwd=cwd, capture_output=True, text=True, check=True
-                )
-
-                if result.stdout:
-                    io.write_line(result.stdout.strip())
+                self._run_script(script, io, cwd)
 
             except subprocess.CalledProcessError as e:
                 io.write_error_line(f"<error>Script failed with exit code {e.returncode}</error>")
-                if e.stdout:
-                    io.write_error_line(f"STDOUT: {e.stdout.strip()}")
-                if e.stderr:
-                    io.write_error_line(f"STDERR: {e.stderr.strip()}")
-
                 sys.exit(e.returncode)
 
             except Exception as e:
@@ -95,3 +86,37 @@ class PreHookPlugin(ApplicationPlugin):
                 sys.exit(1)
 
         io.write_line("<info>Pre-hooks completed successfully.</info>")
+
+    def _run_script(self, script: str, io, cwd) -> None:
+        """Execute a script streaming its output while it runs."""
+
+        with subprocess.Popen(
+            script,
+            shell=True,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            # Drain stderr in the background to avoid blocking the
+            # script when the pipe buffer is full.
+            stderr_reader = threading.Thread(
+                target=self._forward_lines, args=(proc.stderr, io.write_error_line), daemon=True
+            )
+            stderr_reader.start()
+
+            self._forward_lines(proc.stdout, io.write_line)
+
+            stderr_reader.join()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, script)
+
+    @staticmethod
+    def _forward_lines(stream, write) -> None:
+        """Write each line read from the stream."""
+
+        for line in stream:
+            write(line.rstrip("\n"))
@@ -1,3 +1,4 @@
+import functools
 import os
 import warnings
 
@@ -11,7 +12,7 @@ from grimoirelab.core.config.settings import (
 
 import django_rq.queues
 
-from fakeredis import FakeRedis, FakeStrictRedis
+from fakeredis import FakeRedis, FakeServer, FakeStrictRedis
 
 
 INSTALLED_APPS.append("tests")
@@ -66,27 +67,26 @@ DATABASES = {
 
 # Configuration to pretend there is a Redis service
 # available. We need to set up the connection before
-# RQ Django reads the settings. Also, the connection
-# must be the same because in fakeredis connections
-# do not share the state. Therefore, we define a
-# singleton object to reuse it.
-class FakeRedisConn:
-    """Singleton FakeRedis connection."""
+# RQ Django reads the settings. Also, the connections
+# must share the same state, so all of them are
+# connected to the same fake server. One connection
+# is created for each type of client and reused.
+_FAKE_REDIS_SERVER = FakeServer()
 
-    def __init__(self):
-        self.conn = None
 
-    def __call__(self, _, strict):
-        if not self.conn:
-            self.conn = FakeStrictRedis() if strict else FakeRedis()
-        return self.conn
+@functools.cache
+def _fake_redis_conn(strict):
+    """Return the FakeRedis connection for the type of client."""
+
+    redis_class = FakeStrictRedis if strict else FakeRedis
+    return redis_class(server=_FAKE_REDIS_SERVER)
 
 
 RQ_QUEUES["default"] = _RQ_DATABASE  # noqa: F405
 RQ_QUEUES["testing"] = _RQ_DATABASE  # noqa: F405
 RQ["WORKER_CLASS"] = "grimoirelab.core.scheduler.worker.GrimoireLabSimpleWorker"
 
-django_rq.queues.get_redis_connection = FakeRedisConn()
+django_rq.queues.get_redis_connection = lambda _, strict: _fake_redis_conn(bool(strict))
 
 # Ignore warnings raised by the tests
 
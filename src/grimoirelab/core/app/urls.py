@@ -2,6 +2,7 @@
 
 from django.conf import settings
 from django.urls import path, include, re_path
+from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import TemplateView
 
@@ -16,6 +17,10 @@ from ..views import api_login
 from grimoirelab.core.scheduler.urls import urlpatterns as sched_urlpatterns
 from grimoirelab.core.datasources.urls import ecosystems_urlpatterns
 
+# Any path not handled by the backend is a route of the UI app.
+# The excluded prefixes must match whole path segments.
+UI_ROUTE_REGEX = r"^(?!(?:static|scheduler|datasources)(?:/|$)).*\Z"
+
 urlpatterns = [
     path("login", api_login, name="api_login"),
     path("token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
@@ -37,7 +42,7 @@ urlpatterns = [
             ]
         ),
     ),
-    re_path(
-        r"^(?!static|scheduler|datasources).*$", TemplateView.as_view(template_name="index.html")
-    ),
+    # The entry point references the assets of the current build,
+    # so clients must not keep a stale copy after a deploy.
+    re_path(UI_ROUTE_REGEX, never_cache(TemplateView.as_view(template_name="index.html"))),
 ]
@@ -299,6 +299,11 @@ _RQ_DATABASE = {
     "PORT": os.environ.get("GRIMOIRELAB_REDIS_PORT", 6379),
     "PASSWORD": os.environ.get("GRIMOIRELAB_REDIS_PASSWORD", ""),
     "DB": os.environ.get("GRIMOIRELAB_REDIS_DB", 0),
+    # Check idle connections before reusing them, so a connection
+    # closed by Redis or by the network doesn't fail the next command.
+    "REDIS_CLIENT_KWARGS": {
+        "health_check_interval": int(os.environ.get("GRIMOIRELAB_REDIS_HEALTH_CHECK_INTERVAL", 30)),
+    },
 }
 
 RQ_QUEUES = {
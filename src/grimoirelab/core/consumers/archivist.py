@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import typing
 import warnings
@@ -33,7 +34,7 @@ from .consumer import Consumer, Entry
 from .consumer_pool import ConsumerPool
 
 if typing.TYPE_CHECKING:
-    from typing import Iterable
+    from typing import Iterable, Iterator
 
 
 BULK_SIZE = 100
@@ -133,31 +134,16 @@ class OpenSearchArchivist(Consumer):
         else:
             bulk_size = self.bulk_size
 
-        bulk_json = ""
-        entry_map = {}
-        current = 0
-        for entry in entries:
-            event = entry.event
-            data_json = json.dumps(event)
-            bulk_json += '{{"index" : {{"_id" : "{}" }} }}\n'.format(event["id"])
-            bulk_json += data_json + "\n"
-
-            entry_map[event["id"]] = entry.message_id
-            current += 1
-
-            if current >= bulk_size:
-                new_items, failed_ids = self._bulk(body=bulk_json, index=self.index)
-                if new_items > 0:
-                    # ACK successful items
-                    for failed_id in failed_ids:
-                        entry_map.pop(failed_id, None)
-                    self.ack_entries(list(entry_map.values()))
-
-                entry_map = {}
-                current = 0
-                bulk_json = ""
-
-        if current > 0:
+        for batch in _chunks(entries, bulk_size):
+            bulk_lines = []
+            entry_map = {}
+            for entry in batch:
+                event = entry.event
+                bulk_lines.append('{{"index" : {{"_id" : "{}" }} }}'.format(event["id"]))
+                bulk_lines.append(json.dumps(event))
+                entry_map[event["id"]] = entry.message_id
+
+            bulk_json = "\n".join(bulk_lines) + "\n"
             new_items, failed_ids = self._bulk(body=bulk_json, index=self.index)
             if new_items > 0:
                 # ACK successful items
@@ -407,3 +393,11 @@ def create_opensearch_client(
     )
 
     return client
+
+
+def _chunks(entries: Iterable[Entry], size: int) -> Iterator[list[Entry]]:
+    """Split the entries in lists of, at most, `size` elements."""
+
+    entries = iter(entries)
+    while batch := list(itertools.islice(entries, size)):
+        yield batch
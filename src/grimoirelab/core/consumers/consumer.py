@@ -147,11 +147,7 @@ class Consumer:
                 #             2) "value"
                 if response:
                     messages = response[0][1]
-                    for message in messages:
-                        message_id = message[0]
-                        message_data = message[1][b"data"]
-
-                        yield Entry(message_id=message_id, event=json.loads(message_data))
+                    yield from _to_entries(messages)
 
                     # Avoid excessive blocking when no new entries are available
                     block_time = 1000
@@ -190,11 +186,7 @@ class Consumer:
             #          2) "value"
             # 3) (empty array) (message IDs that no longer exist in the stream)
             messages = response[1]
-            for message in messages:
-                message_id = message[0]
-                message_data = message[1][b"data"]
-
-                yield Entry(message_id=message_id, event=json.loads(message_data))
+            yield from _to_entries(messages)
 
             if not messages:
                 break
@@ -219,12 +211,11 @@ class Consumer:
     def ack_entries(self, message_ids: list):
         """Acknowledge a list of message IDs."""
 
-        pipeline = self.connection.pipeline()
-
-        for message_id in message_ids:
-            pipeline.xack(self.stream_name, self.consumer_group, message_id)
+        if not message_ids:
+            return
 
-        pipeline.execute()
+        # XACK accepts several IDs, so a single command is enough
+        self.connection.xack(self.stream_name, self.consumer_group, *message_ids)
 
     def stop(self):
         """Stop the consumer gracefully."""
@@ -247,3 +238,10 @@ class Consumer:
         except redis.exceptions.ResponseError as e:
             if str(e) != "BUSYGROUP Consumer Group name already exists":
                 raise
+
+
+def _to_entries(messages: list[tuple[bytes, dict[bytes, bytes]]]) -> list[Entry]:
+    """Convert the messages read from a stream into entries."""
+
+    loads = json.loads
+    return [Entry(message_id, loads(fields[b"data"])) for message_id, fields in messages]
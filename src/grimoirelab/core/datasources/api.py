@@ -16,23 +16,27 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
+import functools
 import itertools
 
 from rest_framework import (
     generics,
     pagination,
+    parsers,
     response,
     serializers,
     status,
 )
 from drf_spectacular.utils import (
     extend_schema,
+    extend_schema_field,
     extend_schema_view,
     extend_schema_serializer,
     OpenApiParameter,
 )
 from drf_spectacular.types import OpenApiTypes
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch, Q
 from django.conf import settings
 from django.shortcuts import get_object_or_404
 
@@ -44,7 +48,7 @@ from .models import (
 )
 from .utils import generate_uuid
 from ..scheduler.api import EventizerTaskSerializer
-from ..scheduler.scheduler import schedule_task, cancel_task
+from ..scheduler.scheduler import schedule_task, schedule_tasks, cancel_task
 
 
 class DataSourcesPaginator(pagination.PageNumberPagination):
@@ -67,6 +71,12 @@ class DataSourcesPaginator(pagination.PageNumberPagination):
         )
 
 
+def _count_repos():
+    """Return the aggregation that counts the repositories of a project"""
+
+    return Count("dataset__repository", distinct=True)
+
+
 class ProjectSerializer(serializers.ModelSerializer):
     subprojects = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
     repos = serializers.SerializerMethodField()
@@ -88,15 +98,21 @@ class ProjectSerializer(serializers.ModelSerializer):
         value,
     ):
         ecosystem = self.context["ecosystem"]
-        if Project.objects.filter(ecosystem=ecosystem, name=value).count() > 0:
+        if Project.objects.filter(ecosystem=ecosystem, name=value).exists():
             raise serializers.ValidationError(
                 f"Ecosystem '{ecosystem.name}' already has a project named '{value}'"
             )
 
         return value
 
+    @extend_schema_field(OpenApiTypes.INT)
     def get_repos(self, obj):
-        return Repository.objects.filter(dataset__project=obj).distinct().values("uuid")
+        # Views annotate the number of repositories on their querysets
+        # to avoid running a query for each project.
+        repos = getattr(obj, "repos_count", None)
+        if repos is None:
+            repos = Repository.objects.filter(dataset__project=obj).distinct().count()
+        return repos
 
 
 class ParentProjectField(serializers.Field):
@@ -159,31 +175,43 @@ class ProjectList(generics.ListCreateAPIView):
     pagination_class = DataSourcesPaginator
     model = Project
 
+    @functools.cached_property
+    def ecosystem(self):
+        return get_object_or_404(
+            Ecosystem.objects.only("id", "name"), name=self.kwargs.get("ecosystem_name")
+        )
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        ecosystem = get_object_or_404(Ecosystem, name=self.kwargs.get("ecosystem_name"))
-        context.update({"ecosystem": ecosystem})
+        context.update({"ecosystem": self.ecosystem})
 
         return context
 
     def get_queryset(self):
         ecosystem_name = self.kwargs.get("ecosystem_name")
-        queryset = Project.objects.filter(ecosystem__name=ecosystem_name)
         parent_id = self.request.query_params.get("parent_id")
         term = self.request.query_params.get("term")
 
+        filters = Q(ecosystem__name=ecosystem_name)
         if term is not None:
-            queryset = queryset.filter(Q(name__icontains=term) | Q(title__icontains=term))
+            filters &= Q(name__icontains=term) | Q(title__icontains=term)
         if parent_id is not None:
-            queryset = queryset.filter(parent_project_id=parent_id)
+            filters &= Q(parent_project_id=parent_id)
         elif not term and not parent_id:
-            queryset = queryset.filter(parent_project__isnull=True)
+            filters &= Q(parent_project__isnull=True)
+
+        subprojects = Project.objects.only("id", "name", "parent_project_id")
+        queryset = (
+            Project.objects.filter(filters)
+            .only("id", "name", "title", "parent_project_id")
+            .annotate(repos_count=_count_repos())
+            .prefetch_related(Prefetch("subprojects", queryset=subprojects))
+        )
 
         return queryset
 
     def perform_create(self, serializer):
-        ecosystem = serializer.context["ecosystem"]
-        serializer.save(ecosystem=ecosystem)
+        serializer.save(ecosystem=self.ecosystem)
 
 
 class ProjectDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -193,7 +221,13 @@ class ProjectDetail(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         ecosystem_name = self.kwargs.get("ecosystem_name")
-        queryset = Project.objects.filter(ecosystem__name=ecosystem_name)
+        subprojects = Project.objects.annotate(repos_count=_count_repos())
+        queryset = (
+            Project.objects.filter(ecosystem__name=ecosystem_name)
+            .select_related("parent_project")
+            .annotate(repos_count=_count_repos())
+            .prefetch_related(Prefetch("subprojects", queryset=subprojects))
+        )
 
         return queryset
 
@@ -249,23 +283,68 @@ class CreateRepoSerializer(serializers.Serializer):
     category = serializers.CharField()
     project__id = serializers.CharField()
     scheduler = serializers.JSONField(required=False)
+    backend_args = serializers.JSONField(required=False)
 
     def validate(self, attrs):
-        try:
-            Repository.objects.get(
-                uri=attrs["uri"],
-                dataset__project__id=attrs["project__id"],
-                dataset__category=attrs["category"],
-            )
-        except Repository.DoesNotExist:
-            pass
-        else:
+        exists = Repository.objects.filter(
+            uri=attrs["uri"],
+            dataset__project__id=attrs["project__id"],
+            dataset__category=attrs["category"],
+        ).exists()
+        if exists:
             msg = f"Repository '{attrs['uri']}' with category '{attrs['category']}' already exists in project."
             raise serializers.ValidationError(msg)
 
         return attrs
 
 
+class BulkCreateRepoSerializer(serializers.Serializer):
+    repositories = CreateRepoSerializer(many=True, allow_empty=False)
+
+    def validate_repositories(self, value):
+        seen = set()
+        for attrs in value:
+            key = (attrs["uri"], attrs["datasource_type"], attrs["category"])
+            if key in seen:
+                msg = f"Repository '{attrs['uri']}' with category '{attrs['category']}' is duplicated."
+                raise serializers.ValidationError(msg)
+            seen.add(key)
+
+        return value
+
+
+def _prefetch_repo_datasets():
+    """Return the prefetch of the data sets listed as categories of a repository"""
+
+    datasets = DataSet.objects.select_related("task").only(
+        "id", "category", "repository_id", "task"
+    )
+    return Prefetch("dataset_set", queryset=datasets)
+
+
+def _repo_task_spec(data):
+    """Return the parameters of the task that will fetch the data of a repository"""
+
+    job_interval = settings.GRIMOIRELAB_JOB_INTERVAL
+    job_max_retries = settings.GRIMOIRELAB_JOB_MAX_RETRIES
+    if "scheduler" in data:
+        job_interval = data["scheduler"].get("job_interval", job_interval)
+        job_max_retries = data["scheduler"].get("job_max_retries", job_max_retries)
+
+    task_args = {"uri": data["uri"]}
+
+    if "backend_args" in data:
+        task_args = data["backend_args"]
+
+    return {
+        "task_args": task_args,
+        "datasource_type": data["datasource_type"],
+        "datasource_category": data["category"],
+        "job_interval": job_interval,
+        "job_max_retries": job_max_retries,
+    }
+
+
 @extend_schema_view(
     get=extend_schema(
         parameters=[
@@ -287,18 +366,19 @@ class RepoList(generics.ListCreateAPIView):
             name=self.kwargs.get("project_name"),
             ecosystem__name=self.kwargs.get("ecosystem_name"),
         )
-        queryset = Repository.objects.filter(dataset__project=project).distinct()
-
-        datasource = self.request.query_params.get("datasource_type")
-        category = self.request.query_params.get("category")
-        uri = self.request.query_params.get("uri")
+        params = (
+            ("datasource_type", self.request.query_params.get("datasource_type")),
+            ("dataset__category", self.request.query_params.get("category")),
+            ("uri", self.request.query_params.get("uri")),
+        )
+        filters = {lookup: value for lookup, value in params if value is not None}
 
-        if datasource is not None:
-            queryset = queryset.filter(datasource_type=datasource)
-        if category is not None:
-            queryset = queryset.filter(dataset__category=category).distinct()
-        if uri is not None:
-            queryset = queryset.filter(uri=uri)
+        queryset = (
+            Repository.objects.filter(dataset__project=project, **filters)
+            .only("id", "uuid", "uri", "datasource_type")
+            .prefetch_related(_prefetch_repo_datasets())
+            .distinct()
+        )
 
         return queryset
 
@@ -317,39 +397,117 @@ class RepoList(generics.ListCreateAPIView):
             # Create repository if it does not exist yet
             uuid = generate_uuid(str(request.data["uri"]), str(request.data["datasource_type"]))
             repository, _ = Repository.objects.get_or_create(
-                uri=request.data["uri"], datasource_type=request.data["datasource_type"], uuid=uuid
-            )
-            # Create data set
-            dataset = DataSet.objects.create(
-                project=project, repository=repository, category=request.data["category"]
+                uri=request.data["uri"],
+                datasource_type=request.data["datasource_type"],
+                defaults={"uuid": uuid},
             )
+            # Create data set with its task, so it's stored with a single INSERT
+            task = schedule_task("eventizer", **_repo_task_spec(request.data))
+            try:
+                with transaction.atomic():
+                    DataSet.objects.create(
+                        project=project,
+                        repository=repository,
+                        category=request.data["category"],
+                        task=task,
+                    )
+            except Exception as exc:
+                # A task without a data set would run forever, so it
+                # is removed whatever the reason of the failure is.
+                cancel_task(task.uuid)
+                task.delete()
+                if not isinstance(exc, IntegrityError):
+                    raise
+                # The data set was added by another request in the meantime
+                msg = (
+                    f"Repository '{request.data['uri']}' with category "
+                    f"'{request.data['category']}' already exists in project."
+                )
+                return response.Response(
+                    {"non_field_errors": [msg]}, status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+            response_serializer = self.get_serializer(repository)
 
-            # Create task
-            job_interval = settings.GRIMOIRELAB_JOB_INTERVAL
-            job_max_retries = settings.GRIMOIRELAB_JOB_MAX_RETRIES
-            if "scheduler" in request.data:
-                job_interval = request.data["scheduler"].get("job_interval", job_interval)
-                job_max_retries = request.data["scheduler"].get("job_max_retries", job_max_retries)
+            return response.Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        return response.Response(serializer.errors, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
-            task_args = {"uri": request.data["uri"]}
 
-            if "backend_args" in request.data:
-                task_args = request.data["backend_args"]
+@extend_schema(request=BulkCreateRepoSerializer, responses=RepoDetailSerializer(many=True))
+class RepoBulkCreate(generics.CreateAPIView):
+    serializer_class = RepoDetailSerializer
+    model = Repository
+    # Lists of repositories can't be sent as form data
+    parser_classes = [parsers.JSONParser]
 
-            task = schedule_task(
-                "eventizer",
-                task_args,
-                datasource_type=request.data["datasource_type"],
-                datasource_category=request.data["category"],
-                job_interval=job_interval,
-                job_max_retries=job_max_retries,
+    def create(self, request, *args, **kwargs):
+        # Get project from URL params
+        project = get_object_or_404(
+            Project,
+            name=self.kwargs.get("project_name"),
+            ecosystem__name=self.kwargs.get("ecosystem_name"),
+        )
+        payload = request.data
+        if isinstance(payload, dict) and isinstance(payload.get("repositories"), list):
+            repositories = [
+                {**data, "project__id": project.id} if isinstance(data, dict) else data
+                for data in payload["repositories"]
+            ]
+            payload = {**payload, "repositories": repositories}
+
+        # Validate request data
+        serializer = BulkCreateRepoSerializer(data=payload)
+        if not serializer.is_valid():
+            return response.Response(serializer.errors, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        repositories = serializer.validated_data["repositories"]
+        keys = {(data["uri"], data["datasource_type"]) for data in repositories}
+
+        # Tasks are scheduled together before creating the data sets, so
+        # these can be inserted at once with their task assigned. Their
+        # jobs run right away, so tasks must be stored before that.
+        tasks = schedule_tasks("eventizer", [_repo_task_spec(data) for data in repositories])
+        try:
+            with transaction.atomic():
+                # Create the repositories that do not exist yet and
+                # fetch all of them back with a single query
+                new_repos = [
+                    Repository(uri=uri, datasource_type=dtype, uuid=generate_uuid(uri, dtype))
+                    for uri, dtype in keys
+                ]
+                Repository.objects.bulk_create(new_repos, ignore_conflicts=True)
+                stored = Repository.objects.filter(uri__in={uri for uri, _ in keys})
+                repos = {(repo.uri, repo.datasource_type): repo for repo in stored}
+
+                datasets = [
+                    DataSet(
+                        project=project,
+                        repository=repos[(data["uri"], data["datasource_type"])],
+                        category=data["category"],
+                        task=task,
+                    )
+                    for data, task in zip(repositories, tasks)
+                ]
+                DataSet.objects.bulk_create(datasets)
+        except Exception as exc:
+            # Tasks without a data set would run forever, so they
+            # are removed whatever the reason of the failure is.
+            for task in tasks:
+                cancel_task(task.uuid)
+                task.delete()
+            if not isinstance(exc, IntegrityError):
+                raise
+            # Some data set was added by another request in the meantime
+            msg = "Some of the repositories already exist in project."
+            return response.Response(
+                {"non_field_errors": [msg]}, status=status.HTTP_422_UNPROCESSABLE_ENTITY
             )
-            dataset.task = task
-            dataset.save()
-            response_serializer = self.get_serializer(repository)
 
-            return response.Response(response_serializer.data, status=status.HTTP_201_CREATED)
-        return response.Response(serializer.errors, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        queryset = Repository.objects.filter(
+            id__in={dataset.repository_id for dataset in datasets}
+        ).prefetch_related(_prefetch_repo_datasets())
+        response_serializer = self.get_serializer(queryset, many=True)
+
+        return response.Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 
 class RepoDetail(generics.RetrieveDestroyAPIView):
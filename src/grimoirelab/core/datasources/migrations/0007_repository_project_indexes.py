@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datasources', '0006_alter_repository_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='repository',
+            index=models.Index(fields=['datasource_type'], name='repository_datasource_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['ecosystem', 'parent_project'], name='project_ecosystem_parent_idx'),
+        ),
+    ]
@@ -16,11 +16,14 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
+import re
 import uuid
+
 from django.db.models import (
     CharField,
     CASCADE,
     ForeignKey,
+    Index,
     OneToOneField,
 )
 from django.core.validators import RegexValidator
@@ -51,10 +54,18 @@ class Repository(BaseModel):
             "uri",
             "datasource_type",
         ]
+        indexes = [
+            Index(fields=["datasource_type"], name="repository_datasource_type_idx"),
+        ]
 
 
+# Names start with a letter, followed by letters, numbers or
+# hyphens, and can't end with a hyphen. The pattern avoids nested
+# quantifiers, so invalid names are rejected in linear time.
+NAME_REGEX = re.compile(r"\A[a-z](?:[a-z0-9-]*[a-z0-9])?\Z", re.ASCII)
+
 validate_name = RegexValidator(
-    r"^[a-z]+(?:-*[a-z0-9]+)*$",
+    NAME_REGEX,
     (INVALID_NAME_ERROR),
     "invalid",
 )
@@ -107,6 +118,9 @@ class Project(BaseModel):
             "name",
             "ecosystem",
         ]
+        indexes = [
+            Index(fields=["ecosystem", "parent_project"], name="project_ecosystem_parent_idx"),
+        ]
 
 
 class DataSet(BaseModel):
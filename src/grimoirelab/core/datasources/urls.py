@@ -40,6 +40,11 @@ ecosystems_urlpatterns = [
         api.RepoList.as_view(),
         name="repo-list",
     ),
+    path(
+        "<str:ecosystem_name>/projects/<str:project_name>/repos/bulk/",
+        api.RepoBulkCreate.as_view(),
+        name="repo-bulk-create",
+    ),
     path(
         "<str:ecosystem_name>/projects/<str:project_name>/repos/<str:uuid>/",
         api.RepoDetail.as_view(),
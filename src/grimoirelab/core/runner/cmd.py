@@ -22,7 +22,7 @@ import typing
 import os
 
 import click
-import django.core.wsgi
+import django
 
 from .commands.admin import admin
 from .commands.run import run
@@ -68,7 +68,9 @@ def grimoirelab(ctx: Context, cfg: str):
             "or 'GRIMOIRELAB_CONFIG' env variable."
         )
 
-    _ = django.core.wsgi.get_wsgi_application()
+    # Commands only need the apps registry. The WSGI handler, with
+    # its middleware, is built by the server process itself.
+    django.setup()
 
 
 grimoirelab.add_command(admin)
@@ -240,7 +240,8 @@ def _validate_username(username):
 
     if not username:
         return "Username cannot be empty."
-    username_field = get_user_model()._meta.get_field(get_user_model().USERNAME_FIELD)
+    user_model = get_user_model()
+    username_field = user_model._meta.get_field(user_model.USERNAME_FIELD)
     try:
         username_field.clean(username, None)
     except ValidationError as e:
@@ -284,14 +285,20 @@ def remove_jobs():
     queue = django_rq.get_queue()
 
     registries = {
-        "Started": queue.failed_job_registry,
-        "Scheduled": queue.finished_job_registry,
-        "Failed": queue.scheduled_job_registry,
-        "Deferred": queue.started_job_registry,
+        "Started": queue.started_job_registry,
+        "Scheduled": queue.scheduled_job_registry,
+        "Failed": queue.failed_job_registry,
+        "Deferred": queue.deferred_job_registry,
         "Canceled": queue.canceled_job_registry,
-        "Finished": queue.deferred_job_registry,
+        "Finished": queue.finished_job_registry,
     }
-    for key, registry in registries.items():
-        for jid in registry.get_job_ids():
-            registry.remove(jid)
+
+    # Registries are sorted sets, so dropping their keys removes
+    # all the jobs at once, in a single round-trip.
+    with queue.connection.pipeline(transaction=False) as pipe:
+        for registry in registries.values():
+            pipe.delete(registry.key)
+        pipe.execute()
+
+    for key in registries:
         click.echo(f"{key} registry removed.")
@@ -18,26 +18,28 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import logging
 import multiprocessing
 import os
+import random
+import threading
 import time
 import typing
 
-import certifi
 import click
 import django.core
-import django.core.wsgi
+import django.core.management
 import django_rq
-import opensearchpy
 import redis
 import structlog
 
 from django.conf import settings
 from django.db import connections, OperationalError
-from urllib3.util import create_urllib3_context
 
 if typing.TYPE_CHECKING:
+    from typing import Callable
     from click import Context
 
 
@@ -85,9 +87,13 @@ def server(ctx: Context, devel: bool, maintenance_interval: int):
     The server also runs maintenance tasks in the background every
     defined interval (default is 60 seconds). These tasks include
     rescheduling failed tasks and cleaning old jobs.
+
+    The number of server processes defaults to the number of CPUs,
+    up to 4, each one running 4 threads. Use the environment variables
+    GRIMOIRELAB_UWSGI_WORKERS and GRIMOIRELAB_UWSGI_THREADS to set
+    them.
     """
-    _wait_database_ready()
-    _wait_redis_ready()
+    _wait_services_ready(_wait_database_ready, _wait_redis_ready)
 
     env = os.environ
 
@@ -103,8 +109,11 @@ def server(ctx: Context, devel: bool, maintenance_interval: int):
     env["UWSGI_MODULE"] = "grimoirelab.core.app.wsgi:application"
     env["UWSGI_SOCKET"] = "0.0.0.0:9314"
 
-    # Run in multiple threads by default
-    env["UWSGI_WORKERS"] = env.get("GRIMOIRELAB_UWSGI_WORKERS", "1")
+    # Run in multiple processes and threads by default. Processes
+    # scale with the available CPUs, while threads overlap the time
+    # spent waiting for the database and Redis.
+    cpu_count = os.cpu_count() or 1
+    env["UWSGI_WORKERS"] = env.get("GRIMOIRELAB_UWSGI_WORKERS", str(min(cpu_count, 4)))
     env["UWSGI_THREADS"] = env.get("GRIMOIRELAB_UWSGI_THREADS", "4")
 
     # These options shouldn't be modified
@@ -197,8 +206,13 @@ def eventizers(workers: int, verbose: bool, burst: bool):
     Workers get jobs from the GRIMOIRELAB_Q_EVENTIZER_JOBS queue defined
     in the configuration file.
     """
-    _wait_redis_ready()
-    _wait_database_ready()
+    from grimoirelab.core.scheduler.tasks.chronicler import find_perceval_backends
+
+    _wait_services_ready(_wait_redis_ready, _wait_database_ready)
+
+    # Load the backends before starting the pool, so the processes
+    # forked to run the jobs don't have to look for them again.
+    find_perceval_backends()
 
     django.core.management.call_command(
         "rqworker-pool",
@@ -210,10 +224,56 @@ def eventizers(workers: int, verbose: bool, burst: bool):
 
 
 def _sleep_backoff(attempt: int) -> None:
-    """Sleep with exponential backoff"""
+    """Sleep with exponential backoff and equal jitter.
 
+    Half of the capped exponential backoff is always slept and the
+    other half is picked at random, so services started at the same
+    time don't retry in lockstep but the total waiting time is kept.
+    """
     backoff = min(DEFAULT_BACKOFF_MAX, 2**attempt)
-    time.sleep(backoff)
+    delay = backoff / 2 + random.uniform(0, backoff / 2)
+
+    if _stop_service_checks.wait(delay):
+        raise _ServiceCheckCanceled()
+
+
+class _ServiceCheckCanceled(Exception):
+    """Raised when a service check stops because another one failed."""
+
+
+# Set when a service check fails, so the others stop waiting
+_stop_service_checks = threading.Event()
+
+
+def _wait_services_ready(*checks: Callable[[], None]) -> None:
+    """Wait for several services to be available before starting.
+
+    Each check runs in its own thread, so the waiting time is the
+    one of the slowest service instead of the sum of all of them.
+    The first error raised by any of the checks stops the others
+    and it's raised again here.
+
+    :param checks: functions that block until a service is ready.
+    """
+
+    def run_check(check: Callable[[], None]) -> None:
+        try:
+            check()
+        finally:
+            # Database connections belong to the thread that opened
+            # them, so they must be closed before the thread ends.
+            connections.close_all()
+
+    _stop_service_checks.clear()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(run_check, check) for check in checks]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            _stop_service_checks.set()
+            raise
 
 
 def _wait_opensearch_ready(
@@ -221,6 +281,13 @@ def _wait_opensearch_ready(
 ) -> None:
     """Wait for OpenSearch to be available before starting"""
 
+    # Only archivists need OpenSearch, so the client libraries
+    # aren't imported when running any other command.
+    import certifi
+    import opensearchpy
+
+    from urllib3.util import create_urllib3_context
+
     # The 'opensearch' library writes logs with the exceptions while
     # connecting to the database. Disable them temporarily until
     # the service is up. We have to use logging library because structlog
@@ -237,16 +304,19 @@ def _wait_opensearch_ready(
 
     auth = (username, password) if username and password else None
 
+    # The client keeps its connection pool between attempts, so
+    # it's created only once instead of on every retry.
+    client = opensearchpy.OpenSearch(
+        hosts=[url],
+        http_auth=auth,
+        http_compress=True,
+        verify_certs=verify_certs,
+        ssl_context=context,
+        ssl_show_warn=False,
+    )
+
     for attempt in range(DEFAULT_MAX_RETRIES):
         try:
-            client = opensearchpy.OpenSearch(
-                hosts=[url],
-                http_auth=auth,
-                http_compress=True,
-                verify_certs=verify_certs,
-                ssl_context=context,
-                ssl_show_warn=False,
-            )
             client.search(index=index, size=0)
             break
         except opensearchpy.exceptions.NotFoundError:
@@ -278,9 +348,12 @@ def _wait_opensearch_ready(
 def _wait_redis_ready():
     """Wait for Redis to be available before starting"""
 
+    # The client is reused between attempts; its pool
+    # reconnects on its own when the server is up.
+    redis_conn = django_rq.get_connection()
+
     for attempt in range(DEFAULT_MAX_RETRIES):
         try:
-            redis_conn = django_rq.get_connection()
             redis_conn.ping()
             break
         except redis.exceptions.ConnectionError as exc:
@@ -299,13 +372,14 @@ def _wait_redis_ready():
 def _wait_database_ready():
     """Wait for the database to be available before starting."""
 
+    db_conn = connections["default"]
+
     for attempt in range(DEFAULT_MAX_RETRIES):
         try:
-            db_conn = connections["default"]
-            if db_conn:
-                with db_conn.cursor():
-                    pass  # Just test the connection
-                break
+            # Opening the connection is enough to test it;
+            # there is no need to create a cursor.
+            db_conn.ensure_connection()
+            break
 
         except OperationalError as exc:
             logger.warning(
@@ -320,9 +394,6 @@ def _wait_database_ready():
 
     logger.info("Database is ready.")
 
-    # Close all database connections to avoid timed out connections
-    connections.close_all()
-
 
 @run.command()
 @worker_options(workers=20)
@@ -340,14 +411,17 @@ def archivists(workers: int, verbose: bool, burst: bool):
     """
     from grimoirelab.core.consumers.archivist import OpenSearchArchivistPool
 
-    _wait_opensearch_ready(
-        settings.GRIMOIRELAB_ARCHIVIST["STORAGE_URL"],
-        settings.GRIMOIRELAB_ARCHIVIST["STORAGE_USERNAME"],
-        settings.GRIMOIRELAB_ARCHIVIST["STORAGE_PASSWORD"],
-        settings.GRIMOIRELAB_ARCHIVIST["STORAGE_INDEX"],
-        settings.GRIMOIRELAB_ARCHIVIST["STORAGE_VERIFY_CERT"],
+    archivist_cfg = settings.GRIMOIRELAB_ARCHIVIST
+
+    wait_opensearch_ready = functools.partial(
+        _wait_opensearch_ready,
+        archivist_cfg["STORAGE_URL"],
+        archivist_cfg["STORAGE_USERNAME"],
+        archivist_cfg["STORAGE_PASSWORD"],
+        archivist_cfg["STORAGE_INDEX"],
+        archivist_cfg["STORAGE_VERIFY_CERT"],
     )
-    _wait_redis_ready()
+    _wait_services_ready(wait_opensearch_ready, _wait_redis_ready)
 
     pool = OpenSearchArchivistPool(
         # Consumer parameters
@@ -355,17 +429,17 @@ def archivists(workers: int, verbose: bool, burst: bool):
         stream_name=settings.GRIMOIRELAB_EVENTS_STREAM_NAME,
         group_name="opensearch-archivist",
         num_consumers=workers,
-        stream_block_timeout=settings.GRIMOIRELAB_ARCHIVIST["BLOCK_TIMEOUT"],
+        stream_block_timeout=archivist_cfg["BLOCK_TIMEOUT"],
         verbose=verbose,
         # OpenSearch parameters
-        url=settings.GRIMOIRELAB_ARCHIVIST["STORAGE_URL"],
-        user=settings.GRIMOIRELAB_ARCHIVIST["STORAGE_USERNAME"],
-        password=settings.GRIMOIRELAB_ARCHIVIST["STORAGE_PASSWORD"],
-        index=settings.GRIMOIRELAB_ARCHIVIST["STORAGE_INDEX"],
-        bulk_size=settings.GRIMOIRELAB_ARCHIVIST["BULK_SIZE"],
-        verify_certs=settings.GRIMOIRELAB_ARCHIVIST["STORAGE_VERIFY_CERT"],
-        rollover_indices=settings.GRIMOIRELAB_ARCHIVIST["ROLLOVER_INDICES"],
-        rollover_size=settings.GRIMOIRELAB_ARCHIVIST["ROLLOVER_SIZE"],
+        url=archivist_cfg["STORAGE_URL"],
+        user=archivist_cfg["STORAGE_USERNAME"],
+        password=archivist_cfg["STORAGE_PASSWORD"],
+        index=archivist_cfg["STORAGE_INDEX"],
+        bulk_size=archivist_cfg["BULK_SIZE"],
+        verify_certs=archivist_cfg["STORAGE_VERIFY_CERT"],
+        rollover_indices=archivist_cfg["ROLLOVER_INDICES"],
+        rollover_size=archivist_cfg["ROLLOVER_SIZE"],
     )
     pool.start(burst=burst)
 
@@ -386,8 +460,7 @@ def ushers(workers: int, verbose: bool, burst: bool):
     """
     from grimoirelab.core.consumers.identities import SortingHatConsumerPool
 
-    _wait_database_ready()
-    _wait_redis_ready()
+    _wait_services_ready(_wait_database_ready, _wait_redis_ready)
 
     pool = SortingHatConsumerPool(
         # Consumer parameters
@@ -20,9 +20,10 @@ import django_rq
 
 from django.db.models import (
     F,
-    OuterRef,
-    Subquery,
+    Prefetch,
+    Window,
 )
+from django.db.models.functions import FirstValue
 
 from rest_framework import (
     filters,
@@ -33,9 +34,25 @@ from rest_framework import (
 )
 
 from .models import SchedulerStatus, get_registered_task_model
+from .scheduler import get_connection
 from .tasks.models import EventizerTask
 
 
+# Number of jobs listed with each task
+RECENT_JOBS = 10
+
+
+# Labels of the scheduler status, indexed by their value
+STATUS_LABELS = dict(SchedulerStatus.choices)
+
+
+class StatusField(serializers.ReadOnlyField):
+    """Represent a scheduler status with its label."""
+
+    def to_representation(self, value):
+        return str(STATUS_LABELS[value])
+
+
 class EventizerPaginator(pagination.PageNumberPagination):
     page_size = 25
     page_size_query_param = "size"
@@ -53,9 +70,24 @@ class EventizerPaginator(pagination.PageNumberPagination):
         )
 
 
+class EventizerJobSummarySerializer(serializers.ModelSerializer):
+    status = StatusField()
+
+    class Meta:
+        model = get_registered_task_model("eventizer")[1]
+        fields = [
+            "uuid",
+            "job_num",
+            "status",
+            "scheduled_at",
+            "finished_at",
+        ]
+
+
 class EventizerTaskListSerializer(serializers.ModelSerializer):
-    status = serializers.CharField(source="get_status_display")
-    last_jobs = serializers.SerializerMethodField()
+    status = StatusField()
+    # Jobs prefetched by the view, serialized by a single nested field
+    last_jobs = EventizerJobSummarySerializer(source="recent_jobs", many=True, read_only=True)
 
     class Meta:
         model = EventizerTask
@@ -71,14 +103,9 @@ class EventizerTaskListSerializer(serializers.ModelSerializer):
             "datasource_category",
         ]
 
-    def get_last_jobs(self, obj):
-        job_klass = get_registered_task_model("eventizer")[1]
-        jobs = job_klass.objects.filter(task=obj).order_by("-job_num")[:10]
-        return EventizerJobSummarySerializer(jobs, many=True).data
-
 
 class EventizerJobListSerializer(serializers.ModelSerializer):
-    status = serializers.CharField(source="get_status_display")
+    status = StatusField()
 
     class Meta:
         model = get_registered_task_model("eventizer")[1]
@@ -93,7 +120,7 @@ class EventizerJobListSerializer(serializers.ModelSerializer):
 
 
 class EventizerTaskSerializer(serializers.ModelSerializer):
-    status = serializers.CharField(source="get_status_display")
+    status = StatusField()
 
     class Meta:
         model = EventizerTask
@@ -110,22 +137,8 @@ class EventizerTaskSerializer(serializers.ModelSerializer):
         ]
 
 
-class EventizerJobSummarySerializer(serializers.ModelSerializer):
-    status = serializers.CharField(source="get_status_display")
-
-    class Meta:
-        model = get_registered_task_model("eventizer")[1]
-        fields = [
-            "uuid",
-            "job_num",
-            "status",
-            "scheduled_at",
-            "finished_at",
-        ]
-
-
 class EventizerJobSerializer(serializers.ModelSerializer):
-    status = serializers.CharField(source="get_status_display")
+    status = StatusField()
     progress = serializers.SerializerMethodField()
 
     class Meta:
@@ -142,7 +155,7 @@ class EventizerJobSerializer(serializers.ModelSerializer):
 
     def get_progress(self, obj):
         if obj.status == SchedulerStatus.RUNNING:
-            rq_job = django_rq.get_queue(obj.queue).fetch_job(obj.uuid)
+            rq_job = _fetch_rq_job(obj)
             if rq_job:
                 return rq_job.progress.to_dict()
         return obj.progress
@@ -160,12 +173,28 @@ class EventizerJobLogsSerializer(serializers.ModelSerializer):
 
     def get_logs(self, obj):
         if obj.status == SchedulerStatus.RUNNING:
-            rq_job = django_rq.get_queue(obj.queue).fetch_job(obj.uuid)
+            rq_job = _fetch_rq_job(obj)
             if rq_job:
                 return rq_job.job_log
         return obj.logs
 
 
+def _fetch_rq_job(job):
+    """Return the RQ job of a running job, or None if it's gone"""
+
+    # Reuse the connection of the queue instead of opening a new one per request
+    queue = django_rq.get_queue(job.queue, connection=get_connection(job.queue))
+    return queue.fetch_job(job.uuid)
+
+
+def _recent_jobs_queryset():
+    """Return the queryset to fetch the last jobs of eventizer tasks"""
+
+    _, job_class = get_registered_task_model("eventizer")
+    fields = EventizerJobSummarySerializer.Meta.fields
+    return job_class.objects.only("task_id", *fields).order_by("-job_num")
+
+
 class EventizerTaskList(generics.ListAPIView):
     serializer_class = EventizerTaskListSerializer
     pagination_class = EventizerPaginator
@@ -177,24 +206,46 @@ class EventizerTaskList(generics.ListAPIView):
     ordering = [F("last_run").desc(nulls_first=True)]
 
     def get_queryset(self):
-        queryset = EventizerTask.objects.all()
+        _, job_class = get_registered_task_model("eventizer")
+        # Fetch the last jobs of the whole page in a single query
+        recent_jobs = Prefetch("jobs", _recent_jobs_queryset()[:RECENT_JOBS], to_attr="recent_jobs")
+        # Skip the columns the serializer doesn't use, like the task args
+        queryset = EventizerTask.objects.prefetch_related(recent_jobs).only(
+            "id",
+            "uuid",
+            "status",
+            "runs",
+            "failures",
+            "last_run",
+            "scheduled_at",
+            "datasource_type",
+            "datasource_category",
+        )
         status = self.request.query_params.get("status")
         last_run_status = self.request.query_params.get("last_run_status")
         if status is not None:
             if int(status) == SchedulerStatus.FAILED:
-                queryset = queryset.filter(jobs__status=status).distinct()
+                # Semi-join on the failed jobs, so there are no
+                # duplicated rows to remove with DISTINCT
+                failed_jobs = job_class.objects.filter(status=status).values("task_id")
+                queryset = queryset.filter(id__in=failed_jobs)
             else:
                 queryset = queryset.filter(status=status)
         if last_run_status is not None:
-            annotation = Subquery(
-                get_registered_task_model("eventizer")[1]
-                .objects.filter(task_id=OuterRef("id"), finished_at__isnull=False)
-                .order_by("-job_num")
-                .values("status")[:1]
+            # Get the status of the last finished job of each task in a
+            # single pass, instead of running a subquery for every task.
+            # Filtering on the window is applied after computing it, so
+            # only the status of the last job is compared.
+            last_status = Window(
+                FirstValue("status"), partition_by=F("task_id"), order_by=F("job_num").desc()
             )
-            queryset = queryset.annotate(last_run_status=annotation).filter(
-                last_run_status=last_run_status
+            last_jobs = (
+                job_class.objects.filter(finished_at__isnull=False)
+                .annotate(last_status=last_status)
+                .filter(last_status=last_run_status)
+                .values("task_id")
             )
+            queryset = queryset.filter(id__in=last_jobs)
         return queryset
 
 
@@ -214,6 +265,7 @@ class EventizerJobList(generics.ListAPIView):
         queryset = (
             get_registered_task_model("eventizer")[1]
             .objects.filter(task__uuid=task_id)
+            .only(*EventizerJobListSerializer.Meta.fields)
             .order_by("-scheduled_at")
         )
         status = self.request.query_params.get("status")
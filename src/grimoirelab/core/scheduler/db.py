@@ -77,8 +77,11 @@ def find_job(job_uuid: str) -> Job:
     :raises NotFoundError: if the job is not found.
     """
     for _, job_class in get_all_registered_task_models():
+        # Jobs are looked up to update their state, so the task is
+        # fetched with them and their JSON columns are deferred.
+        queryset = job_class.objects.select_related("task").defer("job_args", "progress", "logs")
         try:
-            job = job_class.objects.get(uuid=job_uuid)
+            job = queryset.get(uuid=job_uuid)
         except job_class.DoesNotExist:
             continue
         else:
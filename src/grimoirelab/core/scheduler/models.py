@@ -23,15 +23,17 @@ import uuid
 
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.db.models import (
     BooleanField,
     CharField,
     DateTimeField,
-    IntegerField,
     JSONField,
     PositiveIntegerField,
+    PositiveSmallIntegerField,
     IntegerChoices,
     ForeignKey,
+    Index,
     CASCADE,
 )
 from django.utils.translation import gettext_lazy as _
@@ -102,7 +104,7 @@ class Task(BaseModel):
     task_args = JSONField(null=True, default=None)
 
     # Status data
-    status = IntegerField(
+    status = PositiveSmallIntegerField(
         choices=SchedulerStatus.choices,
         default=SchedulerStatus.NEW,
     )
@@ -121,6 +123,11 @@ class Task(BaseModel):
 
     class Meta:
         abstract = True
+        # Index names are generated by Django for each subclass,
+        # so they always fit the length limit of the databases.
+        indexes = [
+            Index(fields=["status"]),
+        ]
 
     @classmethod
     def create_task(
@@ -171,7 +178,7 @@ class Task(BaseModel):
         else:
             self.failures = 0
         self.status = status
-        self.save()
+        self.save(update_fields=["runs", "last_run", "failures", "status", "last_modified"])
 
     def prepare_job_parameters(self) -> dict[str, Any]:
         """Generate the parameters for running the job."""
@@ -246,7 +253,9 @@ class Job(BaseModel):
     job_args = JSONField(null=True, default=None)
 
     # Status
-    status = IntegerField(choices=SchedulerStatus.choices, default=SchedulerStatus.ENQUEUED)
+    status = PositiveSmallIntegerField(
+        choices=SchedulerStatus.choices, default=SchedulerStatus.ENQUEUED
+    )
     progress = JSONField(encoder=JobResultEncoder, null=True, default=None)
     logs = JSONField(null=True, default=None)
 
@@ -258,6 +267,11 @@ class Job(BaseModel):
 
     class Meta:
         abstract = True
+        # Index names are generated by Django for each subclass,
+        # so they always fit the length limit of the databases.
+        indexes = [
+            Index(fields=["task", "job_num"]),
+        ]
 
     def save_run(
         self, status: SchedulerStatus, progress: Any = None, logs: list[str] = None
@@ -276,8 +290,12 @@ class Job(BaseModel):
         self.status = status
         self.progress = progress
         self.logs = logs
-        self.save()
-        self.task.save_run(status)
+
+        # Both rows are written in the same transaction, so they
+        # are committed at once and never left out of sync.
+        with transaction.atomic():
+            self.save(update_fields=["finished_at", "status", "progress", "logs", "last_modified"])
+            self.task.save_run(status)
 
     @property
     def job_id(self) -> str:
@@ -356,10 +374,10 @@ def get_registered_task_model(task_type: str) -> tuple[type[Task], type[Job]]:
 
     :raises KeyError: if the task type is not registered.
     """
-    if task_type not in GRIMOIRELAB_TASK_MODELS:
-        raise KeyError(f"{task_type} is not a valid task type")
-
-    return GRIMOIRELAB_TASK_MODELS[task_type]
+    try:
+        return GRIMOIRELAB_TASK_MODELS[task_type]
+    except KeyError:
+        raise KeyError(f"{task_type} is not a valid task type") from None
 
 
 def get_all_registered_task_models() -> Iterator[type[Task], type[Job]]:
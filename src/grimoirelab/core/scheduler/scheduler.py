@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import typing
 import uuid
 
@@ -29,6 +30,8 @@ import rq.job
 import structlog
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
 from rq.registry import StartedJobRegistry
 from rq.command import send_stop_job_command
 
@@ -63,6 +66,20 @@ RQ_JOB_STOPPED_STATUS = [
 logger = structlog.get_logger(__name__)
 
 
+@functools.cache
+def get_connection(queue: str) -> redis.Redis:
+    """Return the Redis connection used by the queue.
+
+    'django_rq' creates a new client, with its own pool, every time
+    a connection is requested. The connection is created only once
+    per process, so the pool and the Redis server version that RQ
+    stores on the connection are reused between jobs.
+
+    :param queue: name of the queue.
+    """
+    return django_rq.get_connection(queue)
+
+
 def schedule_task(
     task_type: str,
     task_args: dict[str, Any],
@@ -87,7 +104,7 @@ def schedule_task(
     task = task_class.create_task(
         task_args, job_interval, job_max_retries, burst=burst, *args, **kwargs
     )
-    _enqueue_task(task, scheduled_at=datetime_utcnow())
+    _enqueue_task(task)
 
     logger.info(
         "task scheduled",
@@ -101,6 +118,119 @@ def schedule_task(
     return task
 
 
+def schedule_tasks(task_type: str, tasks_specs: list[dict[str, Any]]) -> list[Task]:
+    """Schedule several tasks of the same type at once.
+
+    Each entry of `tasks_specs` contains the keyword arguments
+    that `schedule_task` would receive for that task (`task_args`,
+    `job_interval`, `job_max_retries`, `burst`, plus the extra
+    arguments of the task type). Tasks are created one by one,
+    because MySQL doesn't return the primary keys of rows inserted
+    in bulk. The first job of every task is stored with a single
+    query and all of them are sent to Redis using one pipeline per
+    queue, instead of a round-trip per job. Jobs are added to their
+    queues to run as soon as possible.
+
+    :param task_type: type of the tasks to be scheduled.
+    :param tasks_specs: list with the parameters of each task.
+
+    :return: the list of scheduled task objects.
+    """
+    task_class, job_class = get_registered_task_model(task_type)
+
+    tasks = []
+    for spec in tasks_specs:
+        spec = dict(spec)
+        task = task_class.create_task(
+            spec.pop("task_args"),
+            spec.pop("job_interval", settings.GRIMOIRELAB_JOB_INTERVAL),
+            spec.pop("job_max_retries", settings.GRIMOIRELAB_JOB_MAX_RETRIES),
+            burst=spec.pop("burst", False),
+            **spec,
+        )
+        tasks.append(task)
+
+    if not tasks:
+        return tasks
+
+    scheduled_at = datetime_utcnow()
+
+    jobs = [
+        job_class(
+            uuid=str(uuid.uuid4()),
+            job_num=1,
+            job_args=task.prepare_job_parameters(),
+            queue=task.default_job_queue,
+            scheduled_at=scheduled_at,
+            task=task,
+        )
+        for task in tasks
+    ]
+
+    # Tasks must be stored as enqueued before their jobs reach Redis.
+    # After that, workers can run the jobs and update the tasks.
+    with transaction.atomic():
+        job_class.objects.bulk_create(jobs, batch_size=500)
+        task_class.objects.filter(pk__in=[task.pk for task in tasks]).update(
+            status=SchedulerStatus.ENQUEUED,
+            scheduled_at=scheduled_at,
+            last_modified=datetime_utcnow(),
+        )
+    for task in tasks:
+        task.status = SchedulerStatus.ENQUEUED
+        task.scheduled_at = scheduled_at
+
+    try:
+        queues = {}
+        for task, job in zip(tasks, jobs):
+            if job.queue not in queues:
+                queue_rq = django_rq.get_queue(job.queue, connection=get_connection(job.queue))
+                queues[job.queue] = (queue_rq, queue_rq.connection.pipeline(transaction=False))
+            queue_rq, pipe = queues[job.queue]
+
+            # Same as 'enqueue' but writing to the pipeline; jobs
+            # run right away, so they skip the scheduled registry.
+            rq_job = queue_rq.create_job(
+                task.job_function,
+                kwargs=job.job_args,
+                timeout=settings.GRIMOIRELAB_JOB_TIMEOUT,
+                result_ttl=settings.GRIMOIRELAB_JOB_RESULT_TTL,
+                job_id=job.uuid,
+                on_success=rq.job.Callback(task.on_success_callback),
+                on_failure=rq.job.Callback(task.on_failure_callback),
+            )
+            queue_rq.enqueue_job(rq_job, pipeline=pipe)
+
+        for _, pipe in queues.values():
+            pipe.execute()
+    except Exception as ex:
+        now = datetime_utcnow()
+        with transaction.atomic():
+            job_class.objects.filter(uuid__in=[job.uuid for job in jobs]).update(
+                status=SchedulerStatus.FAILED, last_modified=now
+            )
+            task_class.objects.filter(pk__in=[task.pk for task in tasks]).update(
+                status=SchedulerStatus.FAILED, last_modified=now
+            )
+        for task in tasks:
+            task.status = SchedulerStatus.FAILED
+        logger.error(
+            "job scheduling",
+            task_uuids=[task.uuid for task in tasks],
+            exc_info=ex,
+        )
+        raise ex
+
+    logger.info(
+        "tasks scheduled",
+        task_type=task_type,
+        task_uuids=[task.uuid for task in tasks],
+        scheduled_at=scheduled_at,
+    )
+
+    return tasks
+
+
 def cancel_task(task_uuid: str) -> None:
     """Cancel a task that is scheduled and its jobs.
 
@@ -113,24 +243,33 @@ def cancel_task(task_uuid: str) -> None:
     """
     task = find_task(task_uuid)
 
-    jobs = task.jobs.all()
-    for job in jobs:
-        connection = django_rq.get_connection(task.default_job_queue)
-        try:
-            job_rq = rq.job.Job.fetch(job.uuid, connection=connection)
-        except rq.exceptions.NoSuchJobError:
-            continue
-        if job_rq.get_status() == rq.job.JobStatus.STARTED:
-            send_stop_job_command(connection, job_rq.id)
-        job_rq.delete()
+    # All the jobs of a task run on the same queue, so they share
+    # the connection instead of creating a new client per job.
+    connection = get_connection(task.default_job_queue)
+
+    # Jobs are fetched and deleted from Redis in bulk, using
+    # pipelines instead of several round-trips per job.
+    job_uuids = list(task.jobs.values_list("uuid", flat=True))
+    jobs_rq = [
+        job_rq
+        for job_rq in rq.job.Job.fetch_many(job_uuids, connection=connection)
+        if job_rq is not None
+    ]
 
-        if job.status not in (SchedulerStatus.FAILED, SchedulerStatus.COMPLETED):
-            job.status = SchedulerStatus.CANCELED
-            job.save()
+    with connection.pipeline(transaction=False) as pipe:
+        for job_rq in jobs_rq:
+            if job_rq.get_status(refresh=False) == rq.job.JobStatus.STARTED:
+                send_stop_job_command(connection, job_rq.id)
+            job_rq.delete(pipeline=pipe)
+        pipe.execute()
+
+    task.jobs.filter(uuid__in=[job_rq.id for job_rq in jobs_rq]).exclude(
+        status__in=(SchedulerStatus.FAILED, SchedulerStatus.COMPLETED)
+    ).update(status=SchedulerStatus.CANCELED, last_modified=datetime_utcnow())
 
     if task.status not in (SchedulerStatus.COMPLETED, SchedulerStatus.FAILED):
         task.status = SchedulerStatus.CANCELED
-        task.save()
+        task.save(update_fields=["status", "last_modified"])
 
     logger.info("task canceled", task_uuid=task.uuid)
 
@@ -152,13 +291,11 @@ def reschedule_task(task_uuid: str) -> None:
         # Cancel the enqueued job and force the execution
         job = task.jobs.order_by("-scheduled_at").first()
         try:
-            job_rq = rq.job.Job.fetch(
-                job.uuid, connection=django_rq.get_connection(task.default_job_queue)
-            )
+            job_rq = rq.job.Job.fetch(job.uuid, connection=get_connection(task.default_job_queue))
             job_rq.delete()
         except (rq.exceptions.NoSuchJobError, rq.exceptions.InvalidJobOperation):
             pass
-        _schedule_job(task, job, datetime_utcnow(), job.job_args)
+        _schedule_job(task, job, datetime_utcnow(), job.job_args, run_now=True)
     elif task.status == SchedulerStatus.RUNNING:
         # Make sure it is running
         job = task.jobs.order_by("-scheduled_at").first()
@@ -186,7 +323,13 @@ def maintain_tasks() -> None:
     tasks = find_tasks_by_status(active_status)
 
     for task in tasks:
-        job_db = task.jobs.filter(status__in=active_status).order_by("-scheduled_at").first()
+        # Only the fields needed to check the job are loaded
+        job_db = (
+            task.jobs.filter(status__in=active_status)
+            .only("id", "uuid", "status", "queue", "scheduled_at", "task_id")
+            .order_by("-scheduled_at")
+            .first()
+        )
 
         if not _is_job_removed_or_stopped(job_db, task.default_job_queue):
             continue
@@ -215,7 +358,7 @@ def _is_job_removed_or_stopped(job: Job, queue: str) -> bool:
     :param queue: queue where the job is enqueued.
     """
     try:
-        connection = django_rq.get_connection(queue)
+        connection = get_connection(queue)
         job_rq = rq.job.Job.fetch(job.uuid, connection=connection)
         status = job_rq.get_status()
         if status == rq.job.JobStatus.STARTED:
@@ -247,7 +390,8 @@ def _enqueue_task(task: Task, scheduled_at: datetime.datetime | None = None) ->
 
     :return: the job object created.
     """
-    if not scheduled_at:
+    run_now = not scheduled_at
+    if run_now:
         scheduled_at = datetime_utcnow()
 
     job_args = task.prepare_job_parameters()
@@ -255,47 +399,79 @@ def _enqueue_task(task: Task, scheduled_at: datetime.datetime | None = None) ->
 
     _, job_class = get_registered_task_model(task.task_type)
 
+    # The last job number is read from the (task, job_num) index,
+    # so there is no need to count all the jobs of the task.
+    last_job = job_class.objects.filter(task=task).aggregate(job_num=Max("job_num"))
+    job_num = (last_job["job_num"] or 0) + 1
+
     job = job_class.objects.create(
         uuid=str(uuid.uuid4()),
-        job_num=job_class.objects.filter(task=task).count() + 1,
+        job_num=job_num,
         job_args=job_args,
         queue=queue,
         scheduled_at=scheduled_at,
         task=task,
     )
 
-    _schedule_job(task, job, scheduled_at, job_args)
+    _schedule_job(task, job, scheduled_at, job_args, run_now=run_now)
 
     return job
 
 
 def _schedule_job(
-    task: Task, job: Job, scheduled_at: datetime.datetime, job_args: dict[str, Any]
+    task: Task,
+    job: Job,
+    scheduled_at: datetime.datetime,
+    job_args: dict[str, Any],
+    run_now: bool = False,
 ) -> rq.job.Job:
-    """Schedule the job to be executed."""
+    """Schedule the job to be executed.
+
+    Jobs that have to run as soon as possible are added directly
+    to the queue; the rest are scheduled to be run at the given time.
+    """
 
     queue = task.default_job_queue
 
-    try:
-        queue_rq = django_rq.get_queue(queue)
-        rq_job = queue_rq.enqueue_at(
-            datetime=scheduled_at,
-            f=task.job_function,
-            result_ttl=settings.GRIMOIRELAB_JOB_RESULT_TTL,
-            job_timeout=settings.GRIMOIRELAB_JOB_TIMEOUT,
-            on_success=rq.job.Callback(task.on_success_callback),
-            on_failure=rq.job.Callback(task.on_failure_callback),
-            job_id=job.uuid,
-            **job_args,
-        )
+    # New jobs are stored already enqueued at the scheduled time, so
+    # only rescheduled jobs need to be updated.
+    update_job = job.status != SchedulerStatus.ENQUEUED or job.scheduled_at != scheduled_at
 
-        job.status = SchedulerStatus.ENQUEUED
-        task.status = SchedulerStatus.ENQUEUED
-        job.scheduled_at = scheduled_at
-        task.scheduled_at = scheduled_at
+    job.status = SchedulerStatus.ENQUEUED
+    task.status = SchedulerStatus.ENQUEUED
+    job.scheduled_at = scheduled_at
+    task.scheduled_at = scheduled_at
+
+    # The status is stored before adding the job to Redis. After that,
+    # a worker can run the job and update both objects at any moment.
+    # Only the scheduling fields change here; store both objects at
+    # once without rewriting the other columns.
+    with transaction.atomic():
+        if update_job:
+            job.save(update_fields=["status", "scheduled_at", "last_modified"])
+        task.save(update_fields=["status", "scheduled_at", "last_modified"])
+
+    try:
+        queue_rq = django_rq.get_queue(queue, connection=get_connection(queue))
+        job_params = {
+            "result_ttl": settings.GRIMOIRELAB_JOB_RESULT_TTL,
+            "job_timeout": settings.GRIMOIRELAB_JOB_TIMEOUT,
+            "on_success": rq.job.Callback(task.on_success_callback),
+            "on_failure": rq.job.Callback(task.on_failure_callback),
+            "job_id": job.uuid,
+        }
+        if run_now:
+            # Workers pick the job from the queue without
+            # waiting for the scheduler to poll for it.
+            rq_job = queue_rq.enqueue(task.job_function, **job_params, **job_args)
+        else:
+            rq_job = queue_rq.enqueue_at(scheduled_at, task.job_function, **job_params, **job_args)
     except Exception as ex:
         job.status = SchedulerStatus.FAILED
         task.status = SchedulerStatus.FAILED
+        with transaction.atomic():
+            job.save(update_fields=["status", "last_modified"])
+            task.save(update_fields=["status", "last_modified"])
         logger.error(
             "job scheduling",
             job_uuid=job.uuid,
@@ -303,9 +479,6 @@ def _schedule_job(
             exc_info=ex,
         )
         raise ex
-    finally:
-        job.save()
-        task.save()
 
     logger.info(
         "job scheduled",
@@ -400,7 +573,7 @@ def _on_failure_callback(
         return
     else:
         task.status = SchedulerStatus.RECOVERY
-        task.save()
+        task.save(update_fields=["status", "last_modified"])
         scheduled_at = datetime_utcnow() + datetime.timedelta(seconds=task.job_interval)
         _enqueue_task(task, scheduled_at=scheduled_at)
         log.error("task failed; recovered")
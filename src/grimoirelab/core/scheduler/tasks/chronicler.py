@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import functools
 import typing
 
 import cloudevents.conversion
@@ -40,6 +41,17 @@ if typing.TYPE_CHECKING:
 logger = structlog.get_logger("__name__")
 
 
+@functools.cache
+def find_perceval_backends() -> dict[str, type[perceval.backend.Backend]]:
+    """Return the Perceval backends available, indexed by name.
+
+    Looking for the backends imports all the modules of the
+    package, so they are searched once per process. Backends
+    can't change while the process is running.
+    """
+    return perceval.backend.find_backends(perceval.backends)[0]
+
+
 def chronicler_job(
     datasource_type: str,
     datasource_category: str,
@@ -70,8 +82,7 @@ def chronicler_job(
     rq_job = rq.get_current_job()
 
     try:
-        backends = perceval.backend.find_backends(perceval.backends)[0]
-        backend_class = backends[datasource_type]
+        backend_class = find_perceval_backends()[datasource_type]
     except KeyError:
         raise NotFoundError(element=datasource_type)
 
@@ -242,11 +253,7 @@ class ChroniclerArgumentGenerator:
 def get_chronicler_argument_generator(name: str) -> ChroniclerArgumentGenerator:
     """Get the argument generator for a backend."""
 
-    generators = {
-        "git": GitArgumentGenerator,
-        "github": GitHubArgumentGenerator,
-    }
-    return generators.get(name.lower(), ChroniclerArgumentGenerator)
+    return ARGUMENT_GENERATORS.get(name.lower(), ChroniclerArgumentGenerator)
 
 
 class GitArgumentGenerator(ChroniclerArgumentGenerator):
@@ -363,3 +370,9 @@ class GitLabArgumentGenerator(GitHubArgumentGenerator):
     """Chronicler argument generator for GitLab."""
 
     pass
+
+
+ARGUMENT_GENERATORS = {
+    "git": GitArgumentGenerator,
+    "github": GitHubArgumentGenerator,
+}
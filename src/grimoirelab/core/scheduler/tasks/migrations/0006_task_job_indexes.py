@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_canceled_status"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="eventizertask",
+            index=models.Index(fields=["status"], name="eventizertask_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="eventizerjob",
+            index=models.Index(fields=["task", "job_num"], name="eventizerjob_task_num_idx"),
+        ),
+    ]
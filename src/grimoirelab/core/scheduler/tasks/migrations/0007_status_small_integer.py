@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_task_job_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="eventizerjob",
+            name="status",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "new"),
+                    (2, "enqueued"),
+                    (3, "running"),
+                    (4, "completed"),
+                    (5, "failed"),
+                    (6, "recovery"),
+                    (7, "canceled"),
+                ],
+                default=2,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="eventizertask",
+            name="status",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "new"),
+                    (2, "enqueued"),
+                    (3, "running"),
+                    (4, "completed"),
+                    (5, "failed"),
+                    (6, "recovery"),
+                    (7, "canceled"),
+                ],
+                default=1,
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-16 10:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_status_small_integer"),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name="eventizertask",
+            new_name="tasks_event_status_93b73b_idx",
+            old_name="eventizertask_status_idx",
+        ),
+        migrations.RenameIndex(
+            model_name="eventizerjob",
+            new_name="tasks_event_task_id_2b28a6_idx",
+            old_name="eventizerjob_task_num_idx",
+        ),
+    ]
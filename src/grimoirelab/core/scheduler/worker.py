@@ -55,9 +55,9 @@ class GrimoireLabWorker(rq.worker.Worker):
         with django.db.transaction.atomic():
             job_db.started_at = datetime_utcnow()
             job_db.status = SchedulerStatus.RUNNING
-            job_db.save()
+            job_db.save(update_fields=["started_at", "status", "last_modified"])
             job_db.task.status = SchedulerStatus.RUNNING
-            job_db.task.save()
+            job_db.task.save(update_fields=["status", "last_modified"])
 
 
 class GrimoireLabSimpleWorker(GrimoireLabWorker, rq.worker.SimpleWorker):
@@ -165,3 +165,66 @@ class TestOpenSearchArchivist(GrimoireLabTestCase):
             index="test_index",
         )
         archivist.ack_entries.assert_called_once_with(["1-0", "3-0"])
+
+    @patch("grimoirelab.core.consumers.archivist.OpenSearch")
+    def test_process_entries_bulk_size(self, mock_opensearch):
+        """Test whether entries are stored in chunks of bulk size"""
+
+        mock_client = MagicMock()
+        mock_opensearch.return_value = mock_client
+        mock_client.bulk.side_effect = [
+            {
+                "items": [
+                    {"index": {"status": 201, "_id": "value_1"}},
+                    {"index": {"status": 201, "_id": "value_2"}},
+                ],
+                "errors": False,
+            },
+            {
+                "items": [
+                    {"index": {"status": 201, "_id": "value_3"}},
+                ],
+                "errors": False,
+            },
+        ]
+        entries = [
+            Entry(message_id="1-0", event={"id": "value_1"}),
+            Entry(message_id="2-0", event={"id": "value_2"}),
+            Entry(message_id="3-0", event={"id": "value_3"}),
+        ]
+
+        archivist = OpenSearchArchivist(
+            connection=self.conn,
+            stream_name="test_stream",
+            consumer_group="test_group",
+            consumer_name="test_consumer",
+            stream_block_timeout=1000,
+            logging_level=logging.DEBUG,
+            url="https://localhost:9200",
+            user="user",
+            password="password",
+            index="test_index",
+            bulk_size=2,
+            verify_certs=False,
+        )
+        # Mock the ack_entries method to check the calls
+        archivist.ack_entries = MagicMock()
+
+        archivist.process_entries(iter(entries))
+
+        self.assertEqual(mock_client.bulk.call_count, 2)
+        mock_client.bulk.assert_any_call(
+            body=(
+                '{"index" : {"_id" : "value_1" } }\n'
+                '{"id": "value_1"}\n'
+                '{"index" : {"_id" : "value_2" } }\n'
+                '{"id": "value_2"}\n'
+            ),
+            index="test_index",
+        )
+        mock_client.bulk.assert_any_call(
+            body='{"index" : {"_id" : "value_3" } }\n{"id": "value_3"}\n',
+            index="test_index",
+        )
+        archivist.ack_entries.assert_any_call(["1-0", "2-0"])
+        archivist.ack_entries.assert_any_call(["3-0"])
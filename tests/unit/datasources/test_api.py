@@ -20,6 +20,7 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, OperationalError
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -258,7 +259,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(response.data["title"], "Example Project")
         self.assertEqual(response.data["parent_project"], None)
         self.assertEqual(len(response.data["subprojects"]), 0)
-        self.assertEqual(len(response.data["repos"]), 0)
+        self.assertEqual(response.data["repos"], 0)
 
     def test_create_project_parent(self):
         """Test creating a project with a parent project"""
@@ -277,7 +278,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(response.data["title"], "Example Project")
         self.assertEqual(response.data["parent_project"], parent_project.id)
         self.assertEqual(len(response.data["subprojects"]), 0)
-        self.assertEqual(len(response.data["repos"]), 0)
+        self.assertEqual(response.data["repos"], 0)
 
     def test_unique_together(self):
         """Test the unique together constraint"""
@@ -381,7 +382,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(project["title"], "Project 1")
         self.assertEqual(project["parent_project"], None)
         self.assertEqual(len(project["subprojects"]), 0)
-        self.assertEqual(len(project["repos"]), 0)
+        self.assertEqual(project["repos"], 0)
 
         project = response.data["results"][1]
         self.assertEqual(project["id"], project2.id)
@@ -390,7 +391,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(len(project["subprojects"]), 1)
         self.assertEqual(project["parent_project"], None)
         self.assertEqual(project["subprojects"][0], project3.name)
-        self.assertEqual(len(project["repos"]), 0)
+        self.assertEqual(project["repos"], 0)
 
     def test_projects_parent_id_filter(self):
         """Test that it returns a list of projects filtered by parent_id"""
@@ -419,7 +420,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(project["parent_project"], project2.id)
         self.assertEqual(len(project["subprojects"]), 1)
         self.assertEqual(project["subprojects"][0], project4.name)
-        self.assertEqual(len(project["repos"]), 0)
+        self.assertEqual(project["repos"], 0)
 
     def test_projects_term_filter(self):
         """Test that it returns a list of projects filtered by term"""
@@ -446,7 +447,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(project["title"], "Project 1")
         self.assertEqual(project["parent_project"], None)
         self.assertEqual(len(project["subprojects"]), 0)
-        self.assertEqual(len(project["repos"]), 0)
+        self.assertEqual(project["repos"], 0)
 
         project = response.data["results"][1]
         self.assertEqual(project["id"], project3.id)
@@ -454,7 +455,7 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(project["title"], "Example project 3")
         self.assertEqual(project["parent_project"], project2.id)
         self.assertEqual(len(project["subprojects"]), 0)
-        self.assertEqual(len(project["repos"]), 0)
+        self.assertEqual(project["repos"], 0)
 
     def test_project_list_pagination(self):
         """Test that it returns a paginated list of projects"""
@@ -479,7 +480,31 @@ class ProjectListApiTest(APITestCase):
         self.assertEqual(project["title"], "Project 2")
         self.assertEqual(len(project["subprojects"]), 0)
         self.assertEqual(project["parent_project"], None)
-        self.assertEqual(len(project["repos"]), 0)
+        self.assertEqual(project["repos"], 0)
+
+    def test_projects_list_repos(self):
+        """Test that it returns the number of repositories of each project"""
+
+        ecosystem = Ecosystem.objects.create(name="ecosystem1", title="Ecosystem 1")
+        project1 = Project.objects.create(name="project1", title="Project 1", ecosystem=ecosystem)
+        project2 = Project.objects.create(name="project2", title="Project 2", ecosystem=ecosystem)
+        repo1 = Repository.objects.create(
+            uri="https://example.com/repo1.git", datasource_type="git"
+        )
+        repo2 = Repository.objects.create(
+            uri="https://example.com/repo2.git", datasource_type="git"
+        )
+        DataSet.objects.create(project=project1, repository=repo1, category="commit")
+        DataSet.objects.create(project=project1, repository=repo1, category="issue")
+        DataSet.objects.create(project=project1, repository=repo2, category="commit")
+
+        url = reverse("projects-list", kwargs={"ecosystem_name": "ecosystem1"})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        projects = {project["id"]: project for project in response.data["results"]}
+        self.assertEqual(projects[project1.id]["repos"], 2)
+        self.assertEqual(projects[project2.id]["repos"], 0)
 
     def test_unauthenticated_request(self):
         """Test that it returns an error if no credentials were provided"""
@@ -521,12 +546,12 @@ class ProjectDetailApiTest(APITestCase):
         self.assertEqual(response.data["title"], "Example Project")
         self.assertEqual(response.data["parent_project"], None)
         self.assertEqual(len(response.data["subprojects"]), 1)
-        self.assertEqual(len(response.data["repos"]), 0)
+        self.assertEqual(response.data["repos"], 0)
         subproject = response.data["subprojects"][0]
         self.assertEqual(subproject["name"], "subproject")
         self.assertEqual(subproject["title"], "Example Subproject")
         self.assertEqual(subproject["subprojects"], [])
-        self.assertEqual(len(subproject["repos"]), 0)
+        self.assertEqual(subproject["repos"], 0)
 
     def test_get_subproject(self):
         """Test that it returns a subproject"""
@@ -549,7 +574,7 @@ class ProjectDetailApiTest(APITestCase):
         self.assertEqual(response.data["name"], "example-project")
         self.assertEqual(response.data["title"], "Example Project")
         self.assertEqual(response.data["subprojects"], [])
-        self.assertEqual(len(response.data["repos"]), 0)
+        self.assertEqual(response.data["repos"], 0)
         self.assertEqual(response.data["parent_project"]["id"], parent_project.id)
         self.assertEqual(response.data["parent_project"]["name"], "parent-project")
         self.assertEqual(response.data["parent_project"]["title"], "Parent project")
@@ -733,6 +758,48 @@ class RepoListApiTest(APITestCase):
         self.assertEqual(dataset["task"]["uuid"], self.task.uuid)
         self.assertEqual(dataset["task"]["job_interval"], 86400)
 
+    @patch("grimoirelab.core.datasources.api.cancel_task")
+    @patch("grimoirelab.core.datasources.api.schedule_task")
+    def test_create_repo_dataset_conflict(self, mock_schedule_task, mock_cancel_task):
+        """Test whether the task is removed when the dataset can't be stored"""
+
+        mock_schedule_task.return_value = self.task
+        url = reverse(
+            "repo-list", kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"}
+        )
+
+        with patch(
+            "grimoirelab.core.datasources.api.DataSet.objects.create",
+            side_effect=IntegrityError,
+        ):
+            response = self.client.post(url, self.valid_data, format="json")
+
+        self.assertEqual(response.status_code, 422)
+        error = "Repository 'https://example.com/repo.git' with category 'commit' already exists in project."
+        self.assertEqual(response.json(), {"non_field_errors": [error]})
+        mock_cancel_task.assert_called_once_with(self.task.uuid)
+        self.assertFalse(EventizerTask.objects.filter(uuid=self.task.uuid).exists())
+
+    @patch("grimoirelab.core.datasources.api.cancel_task")
+    @patch("grimoirelab.core.datasources.api.schedule_task")
+    def test_create_repo_dataset_error(self, mock_schedule_task, mock_cancel_task):
+        """Test whether the task is removed when storing the dataset fails"""
+
+        mock_schedule_task.return_value = self.task
+        url = reverse(
+            "repo-list", kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"}
+        )
+
+        with patch(
+            "grimoirelab.core.datasources.api.DataSet.objects.create",
+            side_effect=OperationalError,
+        ):
+            with self.assertRaises(OperationalError):
+                self.client.post(url, self.valid_data, format="json")
+
+        mock_cancel_task.assert_called_once_with(self.task.uuid)
+        self.assertFalse(EventizerTask.objects.filter(uuid=self.task.uuid).exists())
+
     def test_add_repo_missing_parameters(self):
         """Test adding a repository with missing parameters"""
 
@@ -782,6 +849,128 @@ class RepoListApiTest(APITestCase):
             response.json(), {"detail": "Authentication credentials were not provided."}
         )
 
+    @patch("grimoirelab.core.datasources.api.schedule_tasks")
+    def test_bulk_create_repositories(self, mock_schedule_tasks):
+        """Test creating several repositories in a single request"""
+
+        task2 = EventizerTask.create_task(
+            task_args={"uri": "uri"},
+            job_interval=86400,
+            job_max_retries=3,
+            datasource_type="git",
+            datasource_category="commit",
+        )
+        mock_schedule_tasks.return_value = [self.task, task2]
+        uuid = generate_uuid("https://example.com/repo.git", "git")
+        repository = Repository.objects.create(
+            uri="https://example.com/repo.git", datasource_type="git", uuid=uuid
+        )
+        url = reverse(
+            "repo-bulk-create",
+            kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"},
+        )
+        data = {
+            "repositories": [
+                self.valid_data,
+                {
+                    "uri": "https://example.com/repo2.git",
+                    "datasource_type": "git",
+                    "category": "commit",
+                },
+            ]
+        }
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_schedule_tasks.assert_called_once()
+        task_type, specs = mock_schedule_tasks.call_args.args
+        self.assertEqual(task_type, "eventizer")
+        self.assertEqual(len(specs), 2)
+        self.assertEqual(specs[1]["task_args"], {"uri": "https://example.com/repo2.git"})
+        self.assertEqual(len(response.data), 2)
+
+        repos = {repo["uri"]: repo for repo in response.data}
+        repo = repos["https://example.com/repo.git"]
+        self.assertEqual(repo["uuid"], repository.uuid)
+        self.assertEqual(len(repo["categories"]), 1)
+        self.assertEqual(repo["categories"][0]["category"], "commit")
+        self.assertEqual(repo["categories"][0]["task"]["uuid"], self.task.uuid)
+
+        repo = repos["https://example.com/repo2.git"]
+        self.assertEqual(repo["uuid"], generate_uuid("https://example.com/repo2.git", "git"))
+        self.assertEqual(len(repo["categories"]), 1)
+        self.assertEqual(repo["categories"][0]["category"], "commit")
+        self.assertEqual(repo["categories"][0]["task"]["uuid"], task2.uuid)
+
+        self.assertEqual(DataSet.objects.filter(project=self.project).count(), 2)
+
+    @patch("grimoirelab.core.datasources.api.schedule_tasks")
+    def test_bulk_create_duplicated_repositories(self, mock_schedule_tasks):
+        """Test whether nothing is created when the request has duplicates"""
+
+        url = reverse(
+            "repo-bulk-create",
+            kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"},
+        )
+        data = {"repositories": [self.valid_data, self.valid_data]}
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, 422)
+        error = "Repository 'https://example.com/repo.git' with category 'commit' is duplicated."
+        self.assertEqual(response.json(), {"repositories": [error]})
+        mock_schedule_tasks.assert_not_called()
+        self.assertEqual(Repository.objects.count(), 0)
+
+    @patch("grimoirelab.core.datasources.api.cancel_task")
+    @patch("grimoirelab.core.datasources.api.schedule_tasks")
+    def test_bulk_create_datasets_error(self, mock_schedule_tasks, mock_cancel_task):
+        """Test whether the tasks are removed when the data sets can't be stored"""
+
+        mock_schedule_tasks.return_value = [self.task]
+        url = reverse(
+            "repo-bulk-create",
+            kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"},
+        )
+
+        with patch(
+            "grimoirelab.core.datasources.api.DataSet.objects.bulk_create",
+            side_effect=OperationalError,
+        ):
+            with self.assertRaises(OperationalError):
+                self.client.post(url, {"repositories": [self.valid_data]}, format="json")
+
+        mock_cancel_task.assert_called_once_with(self.task.uuid)
+        self.assertFalse(EventizerTask.objects.filter(uuid=self.task.uuid).exists())
+
+    def test_bulk_create_form_data_not_supported(self):
+        """Test whether only JSON requests are accepted when adding in bulk"""
+
+        url = reverse(
+            "repo-bulk-create",
+            kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"},
+        )
+        response = self.client.post(url, self.valid_data)
+
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    def test_bulk_create_dataset_already_exists(self):
+        """Test adding in bulk a dataset that already exists"""
+
+        repository = Repository.objects.create(
+            uri="https://example.com/repo.git", datasource_type="git"
+        )
+        DataSet.objects.create(
+            project=self.project, repository=repository, category="commit", task=self.task
+        )
+        url = reverse(
+            "repo-bulk-create",
+            kwargs={"ecosystem_name": "ecosystem1", "project_name": "project1"},
+        )
+        response = self.client.post(url, {"repositories": [self.valid_data]}, format="json")
+
+        self.assertEqual(response.status_code, 422)
+        error = "Repository 'https://example.com/repo.git' with category 'commit' already exists in project."
+        self.assertEqual(response.json(), {"repositories": [{"non_field_errors": [error]}]})
+
     def test_project_repo_list(self):
         """Test that it returns a list of repositories for a project"""
 
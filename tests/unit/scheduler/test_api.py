@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) GrimoireLab Contributors
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from grimoirelab_toolkit.datetime import datetime_utcnow
+
+from grimoirelab.core.scheduler.models import SchedulerStatus
+from grimoirelab.core.scheduler.tasks.models import EventizerTask
+
+
+class EventizerTaskListApiTest(APITestCase):
+    """Unit tests for the list of eventizer tasks API"""
+
+    def setUp(self):
+        user = get_user_model().objects.create(username="test", is_superuser=True)
+        self.client.force_authenticate(user=user)
+
+        # The last job of this task completed but an older one failed
+        self.task_completed = self._create_task(
+            "uri1", [SchedulerStatus.FAILED, SchedulerStatus.COMPLETED]
+        )
+        # The last job of this task failed but an older one completed
+        self.task_failed = self._create_task(
+            "uri2", [SchedulerStatus.COMPLETED, SchedulerStatus.FAILED]
+        )
+
+    @staticmethod
+    def _create_task(uri, jobs_status):
+        task = EventizerTask.create_task(
+            task_args={"uri": uri},
+            job_interval=86400,
+            job_max_retries=3,
+            datasource_type="git",
+            datasource_category="commit",
+        )
+        for job_num, job_status in enumerate(jobs_status, start=1):
+            task.jobs.create(
+                uuid=f"{uri}-{job_num}",
+                job_num=job_num,
+                status=job_status,
+                finished_at=datetime_utcnow(),
+            )
+        return task
+
+    def test_filter_last_run_status(self):
+        """Tasks are filtered by the status of their last finished job only"""
+
+        response = self.client.get(
+            "/scheduler/tasks/", {"last_run_status": SchedulerStatus.COMPLETED}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        uuids = [task["uuid"] for task in response.data["results"]]
+        self.assertListEqual(uuids, [self.task_completed.uuid])
+
+        response = self.client.get("/scheduler/tasks/", {"last_run_status": SchedulerStatus.FAILED})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        uuids = [task["uuid"] for task in response.data["results"]]
+        self.assertListEqual(uuids, [self.task_failed.uuid])
+
+    def test_filter_last_run_status_no_jobs(self):
+        """Tasks without finished jobs are not listed"""
+
+        response = self.client.get(
+            "/scheduler/tasks/", {"last_run_status": SchedulerStatus.CANCELED}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+        self.assertListEqual(response.data["results"], [])
+
+    def test_count_after_create_and_delete(self):
+        """The total and the results are updated when tasks are added or removed"""
+
+        response = self.client.get("/scheduler/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        new_task = self._create_task("uri3", [SchedulerStatus.COMPLETED])
+
+        response = self.client.get("/scheduler/tasks/")
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["results"]), 3)
+
+        self.task_failed.delete()
+
+        response = self.client.get("/scheduler/tasks/")
+        self.assertEqual(response.data["count"], 2)
+        uuids = {task["uuid"] for task in response.data["results"]}
+        self.assertSetEqual(uuids, {self.task_completed.uuid, new_task.uuid})
+
+    def test_pages_after_create(self):
+        """New tasks are available in the pages right after creating them"""
+
+        response = self.client.get("/scheduler/tasks/", {"size": 2, "page": 1})
+        self.assertEqual(response.data["total_pages"], 1)
+
+        self._create_task("uri3", [SchedulerStatus.COMPLETED])
+
+        response = self.client.get("/scheduler/tasks/", {"size": 2, "page": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(response.data["total_pages"], 2)
+        self.assertEqual(len(response.data["results"]), 1)
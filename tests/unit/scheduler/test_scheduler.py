@@ -21,6 +21,8 @@ import unittest.mock
 import datetime
 import django.db
 import django_rq.workers
+import redis.client
+import rq
 import rq.job
 
 import grimoirelab_toolkit.datetime
@@ -35,6 +37,7 @@ from grimoirelab.core.scheduler.models import (
 )
 from grimoirelab.core.scheduler.scheduler import (
     schedule_task,
+    schedule_tasks,
     cancel_task,
     maintain_tasks,
     reschedule_task,
@@ -215,6 +218,130 @@ class TestScheduleTask(GrimoireLabTestCase):
         self.assertEqual(task.job_max_retries, 10)
         self.assertEqual(task.burst, True)
 
+    def test_enqueue_task_run_now(self):
+        """Jobs to run as soon as possible skip the scheduled registry"""
+
+        task_args = {
+            "a": 1,
+            "b": 2,
+        }
+        task = SchedulerTestTask.create_task(task_args, 360, 10)
+        job_now = _enqueue_task(task)
+
+        scheduled_at = datetime.datetime(2100, 1, 1, tzinfo=datetime.timezone.utc)
+        job_later = _enqueue_task(task, scheduled_at=scheduled_at)
+
+        queue = django_rq.get_queue("testing")
+        self.assertListEqual(queue.job_ids, [job_now.uuid])
+        self.assertListEqual(queue.scheduled_job_registry.get_job_ids(), [job_later.uuid])
+
+    def test_enqueue_task_job_finished_before_return(self):
+        """Tasks whose jobs finish while enqueuing keep their final status"""
+
+        worker = django_rq.workers.get_worker("testing")
+        enqueue = rq.Queue.enqueue
+
+        def enqueue_and_run_job(queue, *args, **kwargs):
+            # Run the job as soon as it reaches Redis, before
+            # '_enqueue_task' can do anything else.
+            rq_job = enqueue(queue, *args, **kwargs)
+            worker.work(burst=True)
+            return rq_job
+
+        task = SchedulerTestTask.create_task({"a": 1, "b": 2}, 360, 10)
+
+        with unittest.mock.patch.object(
+            rq.Queue, "enqueue", autospec=True, side_effect=enqueue_and_run_job
+        ):
+            job = _enqueue_task(task)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, SchedulerStatus.COMPLETED)
+        self.assertEqual(task.runs, 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, SchedulerStatus.COMPLETED)
+        self.assertEqual(job.progress, 3)
+
+    def test_schedule_tasks(self):
+        """Several tasks are enqueued at once and their jobs are executed"""
+
+        specs = [
+            {"task_args": {"a": 1, "b": 2}},
+            {"task_args": {"a": 3, "b": 4}, "job_interval": 360, "burst": True},
+        ]
+
+        # Enqueue the tasks
+        enqueued_at = grimoirelab_toolkit.datetime.datetime_utcnow()
+        tasks = schedule_tasks("test_task", specs)
+
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(tasks[1].job_interval, 360)
+        self.assertEqual(tasks[1].burst, True)
+
+        for task in tasks:
+            task.refresh_from_db()
+            self.assertEqual(task.status, SchedulerStatus.ENQUEUED)
+            self.assertGreaterEqual(task.scheduled_at, enqueued_at)
+
+            job = task.jobs.get()
+            self.assertEqual(job.job_num, 1)
+            self.assertEqual(job.queue, "testing")
+            self.assertEqual(job.status, SchedulerStatus.ENQUEUED)
+
+        # Run the jobs
+        worker = django_rq.workers.get_worker("testing")
+        processed = worker.work(burst=True, with_scheduler=True)
+
+        self.assertEqual(processed, True)
+
+        # Check task and job state after execution
+        for task, result in zip(tasks, [3, 7]):
+            task.refresh_from_db()
+            self.assertEqual(task.status, SchedulerStatus.COMPLETED)
+            self.assertEqual(task.runs, 1)
+
+            job = task.jobs.get()
+            self.assertEqual(job.status, SchedulerStatus.COMPLETED)
+            self.assertEqual(job.progress, result)
+
+    def test_schedule_tasks_job_finished_before_return(self):
+        """Tasks whose jobs finish while scheduling keep their final status"""
+
+        worker = django_rq.workers.get_worker("testing")
+        execute = redis.client.Pipeline.execute
+        workers_run = []
+
+        def execute_and_run_jobs(pipe, *args, **kwargs):
+            # Run the jobs as soon as they reach Redis, before
+            # 'schedule_tasks' can do anything else.
+            result = execute(pipe, *args, **kwargs)
+            if not workers_run:
+                workers_run.append(worker.work(burst=True))
+            return result
+
+        with unittest.mock.patch.object(
+            redis.client.Pipeline, "execute", autospec=True, side_effect=execute_and_run_jobs
+        ):
+            tasks = schedule_tasks("test_task", [{"task_args": {"a": 1, "b": 2}}])
+
+        self.assertListEqual(workers_run, [True])
+
+        task = tasks[0]
+        task.refresh_from_db()
+        self.assertEqual(task.status, SchedulerStatus.COMPLETED)
+        self.assertEqual(task.runs, 1)
+
+        job = task.jobs.get()
+        self.assertEqual(job.status, SchedulerStatus.COMPLETED)
+        self.assertEqual(job.progress, 3)
+
+    def test_schedule_tasks_empty(self):
+        """No task is scheduled when the list is empty"""
+
+        tasks = schedule_tasks("test_task", [])
+        self.assertListEqual(tasks, [])
+
     def test_enqueue_task(self):
         """A task is enqueued and a job is created and executed using _enqueue_task"""
 